@@ -6,17 +6,36 @@ data preview, and CSV export to Downloads folder.
 
 import os
 import csv
+import random
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from tkinter import font as tkfont
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession, NEVER_EXPIRE
+from urllib3.util.retry import Retry
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Optional, List, Dict
+from queue import Queue
 import threading
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional speedup; stdlib json via response.json() works too
+
+# Load environment variables. Skip the .env stat-walk when the token is
+# already in the environment (warm starts, tests, another module loaded
+# it first); STRAVA_ENV_FILE points frozen deployments at an exact file.
+if "STRAVA_ACCESS_TOKEN" not in os.environ:
+    load_dotenv(os.environ.get("STRAVA_ENV_FILE", ".env"), override=False)
 
 # Small terminal-style ASCII art used in the left panel
 ASCII_ART =  """cutie-extractor@nitro⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
@@ -53,17 +72,274 @@ COLOR = "#FC5200"
 STRAVA_CLIENT_ID = os.getenv("STRAVA_CLIENT_ID")
 STRAVA_ACCESS_TOKEN = os.getenv("STRAVA_ACCESS_TOKEN")
 STRAVA_API_URL = "https://www.strava.com/api/v3"
+# Built once; _get_page runs per page and shouldn't re-format the URL
+ACTIVITIES_URL = f"{STRAVA_API_URL}/athlete/activities"
+
+
+# Column order matches the API docs and extract_activity_data
+FIELDNAMES = (
+    "id",
+    "name",
+    "distance",
+    "moving_time",
+    "elapsed_time",
+    "total_elevation_gain",
+    "start_date",
+    "average_speed",
+    "max_speed",
+    "average_temp",
+    "elev_high",
+    "elev_low",
+    "calories",
+    "pr_count",
+)
+
+# One extracted row. A namedtuple is about a third the size of the
+# 14-key dict it replaced, instantiates faster, and streams positionally
+# into the CSV formatters with no per-field lookup
+Activity = namedtuple("Activity", FIELDNAMES)
+
+# Fetches all 14 fields in one C-level call for fully-populated activities
+_GET_ALL = itemgetter(*FIELDNAMES)
+
+# Unit conversions as multiply-by-reciprocal constants: multiplication
+# is cheaper than division in the per-row hot loops, and the names keep
+# the intent readable
+_M_TO_KM = 1e-3
+_S_TO_MIN = 1.0 / 60.0
+_MS_TO_KMH = 3.6
+
+# Schema-specialized extractor, generated and compiled once at import.
+# The schema is fixed, so the whole transform can be one flat function:
+# _get/_round ride along as default args to stay local-variable loads
+# instead of global lookups, and there is no per-field Python dispatch
+# beyond the 14 .get calls themselves.
+_EXTRACT_SRC = """\
+def _extract_defaults(a, _get=dict.get, _round=round, _Activity=Activity,
+                      _km=_M_TO_KM, _min=_S_TO_MIN, _kmh=_MS_TO_KMH):
+    d = _get(a, "distance") or 0
+    mt = _get(a, "moving_time") or 0
+    avs = _get(a, "average_speed", 0)
+    mxs = _get(a, "max_speed", 0)
+    return _Activity(
+        id=_get(a, "id"),
+        name=_get(a, "name"),
+        distance=_round(d * _km, 2),
+        moving_time=_round(mt * _min, 2),
+        elapsed_time=_get(a, "elapsed_time"),
+        total_elevation_gain=_get(a, "total_elevation_gain"),
+        start_date=_get(a, "start_date", ""),
+        average_speed=_round(avs * _kmh, 2) if avs else avs,  # km/h
+        max_speed=_round(mxs * _kmh, 2) if mxs else mxs,  # km/h
+        average_temp=_get(a, "average_temp"),
+        elev_high=_get(a, "elev_high"),
+        elev_low=_get(a, "elev_low"),
+        calories=_get(a, "calories"),
+        pr_count=_get(a, "pr_count"),
+    )
+"""
+_ns = {
+    "Activity": Activity,
+    "_M_TO_KM": _M_TO_KM,
+    "_S_TO_MIN": _S_TO_MIN,
+    "_MS_TO_KMH": _MS_TO_KMH,
+}
+exec(compile(_EXTRACT_SRC, "<cutie-extractor codegen>", "exec"), _ns)
+_extract_defaults = _ns["_extract_defaults"]
+del _ns
+
+# Sentinel returned by _get_page when the API says we are rate limited
+# and retries with backoff did not clear it
+_RATE_LIMITED = object()
+
+# 429 retry budget per page; waits follow Retry-After when Strava sends
+# it, else exponential backoff, always with jitter so parallel page
+# fetchers don't retry in lockstep
+_MAX_429_RETRIES = 6
+
+# Rough bytes per CSV row, used to pre-size large exports
+_ROW_SIZE_ESTIMATE = 200
+
+
+def _csv_escape(value):
+    """Stringify one CSV cell, quoting only when it actually needs it."""
+    if value is None:
+        return ""
+    s = str(value)
+    if '"' in s:
+        return '"' + s.replace('"', '""') + '"'
+    if "," in s or "\n" in s or "\r" in s:
+        return '"' + s + '"'
+    return s
+
+
+def _format_csv(rows):
+    """Format header plus rows into one string for a single write call.
+
+    The csv module dispatches per cell through Python-level machinery;
+    for the row counts Strava returns, joining the whole file in memory
+    and writing it once is faster and costs only the file's size in RAM.
+    """
+    lines = [",".join(FIELDNAMES)]
+    lines.extend(",".join(map(_csv_escape, row)) for row in rows)
+    lines.append("")  # trailing newline
+    return "\n".join(lines)
+
+
+# Row template for bulk exports, matching FIELDNAMES order; the four
+# float columns format with a fixed {:.2f} instead of per-cell str()
+_BULK_ROW_FMT = "{},{},{:.2f},{:.2f},{},{},{},{:.2f},{:.2f},{},{},{},{},{}"
+
+
+def _format_csv_bulk(rows):
+    """Format extract_bulk row tuples via one precompiled format string.
+
+    Of the fourteen columns only name can contain a comma or quote, so
+    it alone goes through _csv_escape; everything else is emitted
+    directly by the template. None becomes an empty cell, as the csv
+    module would write it.
+    """
+    fmt = _BULK_ROW_FMT.format
+    lines = [",".join(FIELDNAMES)]
+    for (aid, name, dist, mov, elap, gain, date, avg, mx,
+         temp, hi, lo, cal, pr) in rows:
+        lines.append(fmt(
+            "" if aid is None else aid,
+            _csv_escape(name),
+            dist,
+            mov,
+            "" if elap is None else elap,
+            "" if gain is None else gain,
+            "" if date is None else date,
+            avg,
+            mx,
+            "" if temp is None else temp,
+            "" if hi is None else hi,
+            "" if lo is None else lo,
+            "" if cal is None else cal,
+            "" if pr is None else pr,
+        ))
+    lines.append("")  # trailing newline
+    return "\n".join(lines)
+
+
+def _open_csv(filename, estimated_rows=0):
+    """Open a CSV for writing with a large (4 MiB) user-space buffer.
+
+    On POSIX the file is also pre-allocated from the row estimate so the
+    filesystem can reserve space up front; callers must truncate() after
+    writing to trim the unused tail.
+    """
+    buffering = 1 << 22
+    if estimated_rows and hasattr(os, "posix_fallocate"):
+        try:
+            # 0o666 (less umask) like a regular open(); os.open's
+            # default would make the CSV executable
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        except OSError:
+            pass
+        else:
+            try:
+                os.posix_fallocate(fd, 0, estimated_rows * _ROW_SIZE_ESTIMATE)
+                return os.fdopen(
+                    fd, "w", buffering=buffering, encoding="utf-8", newline=""
+                )
+            except OSError:
+                # fallocate unsupported (or disk full): fall back to a
+                # plain open, but don't leak the descriptor
+                os.close(fd)
+    return open(filename, "w", newline="", encoding="utf-8", buffering=buffering)
 
 
 class StravaExtractor:
     """Extracts activity data from the API within a date range."""
 
+    # Number of pages fetched concurrently per window; Strava allows a
+    # handful of parallel requests well below its rate limits
+    PAGE_WINDOW = 4
+
     def __init__(self, access_token: str):
         self.access_token = access_token
         self.headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
+            # JSON pages compress ~5-10x; requests decompresses transparently
+            "Accept-Encoding": "gzip, deflate",
         }
+        # Pooled, disk-cached session: repeat fetches of the same range
+        # answer from SQLite instead of re-spending Strava rate limit,
+        # and paginated fetches reuse one TLS connection. Transient 5xx
+        # responses retry with backoff instead of dropping the rest of
+        # the extraction; 429 is handled explicitly above.
+        cache_dir = Path.home() / ".cache" / "cutie-extractor"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.session = CachedSession(
+            str(cache_dir / "http.sqlite"),
+            backend="sqlite",
+            expire_after=3600,
+            allowable_methods=["GET"],
+        )
+        self.session.headers.update(self.headers)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                ),
+            ),
+        )
+
+    def _get_page(
+        self, after: int, before: int, page: int, per_page: int, expire_after=3600
+    ):
+        """Fetch one page of activities.
+
+        Returns the page list, None on auth failure, or _RATE_LIMITED
+        once the 429 retry budget is spent. A rate-limited request waits
+        out Strava's Retry-After (exponential backoff if absent) and
+        retries the same page, so long extractions stay complete instead
+        of silently dropping their tail.
+        """
+        params = {
+            "after": after,
+            "before": before,
+            "page": page,
+            "per_page": per_page,
+        }
+
+        for attempt in range(_MAX_429_RETRIES):
+            response = self.session.get(
+                ACTIVITIES_URL,
+                params=params,
+                timeout=10,
+                expire_after=expire_after,
+            )
+
+            if response.status_code == 401:
+                return None  # Auth failed
+            if response.status_code != 429:
+                break
+
+            try:
+                delay = float(response.headers.get("Retry-After", 2 ** attempt))
+            except ValueError:
+                # Retry-After can also be an HTTP-date; just back off
+                delay = float(2 ** attempt)
+            time.sleep(delay + random.uniform(0, 1))
+        else:
+            return _RATE_LIMITED
+
+        response.raise_for_status()
+        if orjson is not None:
+            # Decodes the raw bytes 2-3x faster than response.json(),
+            # which adds up across a multi-page fetch
+            return orjson.loads(response.content)
+        return response.json()
 
     def get_activities(
         self,
@@ -72,80 +348,263 @@ class StravaExtractor:
         per_page: int = 200,
         max_activities: Optional[int] = None,
     ) -> List[Dict]:
-        """Fetch activities from the API within a date range."""
+        """Fetch activities from the API within a datetime range."""
+        return self.get_activities_ts(
+            int(start_date.timestamp()),
+            int(end_date.timestamp()),
+            per_page,
+            max_activities,
+        )
+
+    def get_activities_ts(
+        self,
+        after: int,
+        before: int,
+        per_page: int = 200,
+        max_activities: Optional[int] = None,
+    ) -> List[Dict]:
+        """Fetch activities between two epoch timestamps.
+
+        Pages are requested PAGE_WINDOW at a time on a thread pool, so
+        the per-page round-trip latency mostly overlaps instead of
+        adding up; a short or empty page marks the end of the range.
+        Taking raw timestamps keeps datetime allocation off this path —
+        callers only build datetimes for display labels.
+        """
         activities = []
         page = 1
         per_page = min(per_page, 200)
 
+        # Completed activities never change, so pages of a closed
+        # historical range can be cached indefinitely; ranges touching
+        # the last day keep the default 1-hour TTL
+        expire_after = NEVER_EXPIRE if before < time.time() - 86400 else 3600
+
+        with ThreadPoolExecutor(max_workers=self.PAGE_WINDOW) as executor:
+            while True:
+                futures = [
+                    executor.submit(
+                        self._get_page, after, before, p, per_page, expire_after
+                    )
+                    for p in range(page, page + self.PAGE_WINDOW)
+                ]
+
+                for i, future in enumerate(futures):
+                    try:
+                        page_activities = future.result()
+                    except requests.exceptions.RequestException:
+                        self._cancel(futures[i + 1:])
+                        return activities
+
+                    if page_activities is None:  # Auth failed
+                        self._cancel(futures[i + 1:])
+                        return None
+                    if page_activities is _RATE_LIMITED:
+                        self._cancel(futures[i + 1:])
+                        return activities
+
+                    if (
+                        max_activities
+                        and len(activities) + len(page_activities) >= max_activities
+                    ):
+                        # Take just what is needed from the final page
+                        # rather than extending and re-slicing the list
+                        activities.extend(
+                            page_activities[: max_activities - len(activities)]
+                        )
+                        self._cancel(futures[i + 1:])
+                        return activities
+
+                    activities.extend(page_activities)
+
+                    if len(page_activities) < per_page:
+                        # Short page: this was the last one; the rest of
+                        # the window comes back empty
+                        self._cancel(futures[i + 1:])
+                        return activities
+
+                page += self.PAGE_WINDOW
+
+        return activities
+
+    @staticmethod
+    def _cancel(futures):
+        """Cancel any speculative page fetches that have not started."""
+        for future in futures:
+            future.cancel()
+
+    def export_range_to_csv(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        filename: str,
+        per_page: int = 200,
+    ) -> bool:
+        """Fetch, transform and write a date range in one streaming pass.
+
+        Three stages run concurrently, connected by bounded queues: page
+        fetches (network), extract_bulk (CPU) and the CSV write (disk)
+        overlap instead of running back to back, and only a page's worth
+        of raw payload is held in memory at a time. Meant for very large
+        ranges where fetch-everything-then-export is wasteful.
+        """
         after = int(start_date.timestamp())
         before = int(end_date.timestamp())
+        expire_after = NEVER_EXPIRE if before < time.time() - 86400 else 3600
+
+        pages_q: Queue = Queue(maxsize=4)
+        rows_q: Queue = Queue(maxsize=8)
+        auth_failed = []
 
-        while True:
+        def producer():
+            page = 1
             try:
-                params = {
-                    "after": after,
-                    "before": before,
-                    "page": page,
-                    "per_page": per_page,
-                }
-
-                response = requests.get(
-                    f"{STRAVA_API_URL}/athlete/activities",
-                    headers=self.headers,
-                    params=params,
-                    timeout=10,
-                )
+                while True:
+                    page_activities = self._get_page(
+                        after, before, page, per_page, expire_after
+                    )
+                    if page_activities is None:
+                        auth_failed.append(True)
+                        break
+                    if page_activities is _RATE_LIMITED:
+                        break
+                    if page_activities:
+                        pages_q.put(page_activities)
+                    if len(page_activities) < per_page:
+                        break
+                    page += 1
+            except requests.exceptions.RequestException:
+                pass
+            finally:
+                pages_q.put(None)
 
-                if response.status_code == 401:
-                    return None  # Auth failed
-                if response.status_code == 429:
-                    return activities  # Rate limit
+        def transformer():
+            # Sentinel goes out even if a malformed page blows up the
+            # transform — otherwise the writer stage blocks forever
+            try:
+                while True:
+                    page_activities = pages_q.get()
+                    if page_activities is None:
+                        break
+                    for row in self.extract_bulk(page_activities):
+                        rows_q.put(row)
+            finally:
+                rows_q.put(None)
 
-                response.raise_for_status()
-                page_activities = response.json()
+        try:
+            # Row count is unknown up front here, so no pre-allocation —
+            # just the large buffer
+            with _open_csv(filename) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDNAMES)
+                threading.Thread(target=producer, daemon=True).start()
+                threading.Thread(target=transformer, daemon=True).start()
+                # The calling thread is the writer stage
+                writer.writerows(iter(rows_q.get, None))
+
+            return not auth_failed
+        except IOError:
+            return False
 
-                if not page_activities:
-                    break
+    def extract_activity_data(self, activity: Dict) -> Activity:
+        """Extract specified fields from an activity in chronological order per API docs."""
+        try:
+            # Fast path: one itemgetter call instead of 14 .get()s when
+            # every field is present (the common case for ride data)
+            (
+                activity_id,
+                name,
+                distance,
+                moving_time,
+                elapsed_time,
+                elevation_gain,
+                start_date,
+                avg_speed,
+                max_speed,
+                avg_temp,
+                elev_high,
+                elev_low,
+                calories,
+                pr_count,
+            ) = _GET_ALL(activity)
+        except KeyError:
+            return self._extract_with_defaults(activity)
+
+        return Activity(
+            id=activity_id,
+            name=name,
+            distance=round((distance or 0) * _M_TO_KM, 2),  # km
+            moving_time=round((moving_time or 0) * _S_TO_MIN, 2),  # minutes
+            elapsed_time=elapsed_time,  # seconds
+            total_elevation_gain=elevation_gain,  # meters
+            start_date=start_date,
+            average_speed=round(avg_speed * _MS_TO_KMH, 2) if avg_speed else avg_speed,
+            max_speed=round(max_speed * _MS_TO_KMH, 2) if max_speed else max_speed,
+            average_temp=avg_temp,
+            elev_high=elev_high,
+            elev_low=elev_low,
+            calories=calories,
+            pr_count=pr_count,
+        )
 
-                activities.extend(page_activities)
+    def _extract_with_defaults(self, activity: Dict) -> Activity:
+        """Slow path for activities missing one or more fields."""
+        return _extract_defaults(activity)
 
-                if max_activities and len(activities) >= max_activities:
-                    activities = activities[:max_activities]
-                    break
+    def extract_bulk(self, activities: List[Dict]) -> List[tuple]:
+        """Extract many activities at once, as tuples in FIELDNAMES order.
 
-                page += 1
+        Same transform as extract_activity_data, but the unit
+        conversions run as four vectorized NumPy operations instead of
+        Python-level arithmetic per activity — a big win when exporting
+        thousands of rows.
+        """
+        count = len(activities)
 
-            except requests.exceptions.RequestException:
-                break
+        def column(key):
+            return np.fromiter(
+                ((a.get(key) or 0) for a in activities),
+                dtype=np.float64,
+                count=count,
+            )
 
-        return activities
+        dist_km = np.round(column("distance") * _M_TO_KM, 2)
+        moving_min = np.round(column("moving_time") * _S_TO_MIN, 2)
+        avg_kmh = np.round(column("average_speed") * _MS_TO_KMH, 2)
+        max_kmh = np.round(column("max_speed") * _MS_TO_KMH, 2)
+
+        return list(
+            zip(
+                (a.get("id") for a in activities),
+                (a.get("name") for a in activities),
+                dist_km.tolist(),
+                moving_min.tolist(),
+                (a.get("elapsed_time") for a in activities),
+                (a.get("total_elevation_gain") for a in activities),
+                (a.get("start_date", "") for a in activities),
+                avg_kmh.tolist(),
+                max_kmh.tolist(),
+                (a.get("average_temp") for a in activities),
+                (a.get("elev_high") for a in activities),
+                (a.get("elev_low") for a in activities),
+                (a.get("calories") for a in activities),
+                (a.get("pr_count") for a in activities),
+            )
+        )
 
-    def extract_activity_data(self, activity: Dict) -> Dict:
-        """Extract specified fields from an activity in chronological order per API docs."""
-        # Convert m/s to km/h: multiply by 3.6
-        avg_speed_kmh = activity.get("average_speed", 0)
-        max_speed_kmh = activity.get("max_speed", 0)
-        if avg_speed_kmh:
-            avg_speed_kmh = round(avg_speed_kmh * 3.6, 2)
-        if max_speed_kmh:
-            max_speed_kmh = round(max_speed_kmh * 3.6, 2)
-        
-        return {
-            "id": activity.get("id"),
-            "name": activity.get("name"),
-            "distance": round(activity.get("distance", 0) / 1000, 2),  # km
-            "moving_time": round(activity.get("moving_time", 0) / 60, 2),  # minutes
-            "elapsed_time": activity.get("elapsed_time"),  # seconds
-            "total_elevation_gain": activity.get("total_elevation_gain"),  # meters
-            "start_date": activity.get("start_date", ""),
-            "average_speed": avg_speed_kmh,  # km/h
-            "max_speed": max_speed_kmh,  # km/h
-            "average_temp": activity.get("average_temp"),
-            "elev_high": activity.get("elev_high"),
-            "elev_low": activity.get("elev_low"),
-            "calories": activity.get("calories"),
-            "pr_count": activity.get("pr_count"),
-        }
+    def export_rows_to_csv(self, rows: List[Activity], filename: str) -> bool:
+        """Export already-extracted rows to CSV, skipping re-extraction."""
+        if not rows:
+            return False
+
+        try:
+            with _open_csv(filename, estimated_rows=len(rows)) as csvfile:
+                csvfile.write(_format_csv(rows))
+                csvfile.truncate()
+
+            return True
+        except IOError:
+            return False
 
     def export_to_csv(self, activities: List[Dict], filename: str) -> bool:
         """Export activities to CSV file."""
@@ -153,15 +612,19 @@ class StravaExtractor:
             return False
 
         try:
-            fieldnames = list(self.extract_activity_data(activities[0]).keys())
-
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for activity in activities:
-                    extracted = self.extract_activity_data(activity)
-                    writer.writerow(extracted)
+            # Format the whole file in memory and write it in one call
+            # instead of going through the csv module row by row
+            with _open_csv(filename, estimated_rows=len(activities)) as csvfile:
+                if len(activities) >= 1000:
+                    # Big exports: vectorized transform, then the
+                    # format-string emitter instead of per-cell escaping
+                    csvfile.write(_format_csv_bulk(self.extract_bulk(activities)))
+                else:
+                    csvfile.write(_format_csv(
+                        self.extract_activity_data(activity)
+                        for activity in activities
+                    ))
+                csvfile.truncate()
 
             return True
         except IOError:
@@ -171,6 +634,12 @@ class StravaExtractor:
 class StravaGUI:
     """Tkinter GUI for Cutie Extractor"""
 
+    PREVIEW_CHOICES = ("Export CSV", "Back")
+
+    # Safety cap for open-ended fetches; a dense 10-year history could
+    # otherwise chew through dozens of pages and the rate limit
+    ALL_TIME_CAP = 10000
+
     def __init__(self, root):
         self.root = root
         self.root.title("Cutie Extractor")
@@ -187,14 +656,45 @@ class StravaGUI:
         self.extractor = StravaExtractor(STRAVA_ACCESS_TOKEN)
         self.activities = []
 
+        # One persistent worker runs all background jobs (fetches,
+        # exports, warmup) in submission order: no thread creation per
+        # click, and mashing Enter queues work instead of stacking
+        # threads that fight over the GIL
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gui-worker")
+
+        # Resolve (and create) the export directory once instead of
+        # stat-ing the home directory on every export click
+        self._downloads = Path.home() / "Downloads"
+        self._downloads.mkdir(parents=True, exist_ok=True)
+
         self.setup_ui()
 
+        # Warm DNS + TLS to strava.com in the background so the first
+        # real fetch skips the cold handshake (~100-300ms). Failures
+        # don't matter — it's only a warmup.
+        self._worker.submit(self._warm_connection)
+
+    def _warm_connection(self):
+        try:
+            self.extractor.session.head(f"{STRAVA_API_URL}/athlete", timeout=5)
+        except Exception:
+            pass
+
     def setup_ui(self):
         """Setup the GUI components in a terminal-inspired layout.
 
         Left: ASCII art (50%). Right: terminal-style control area with
         arrow-key navigation for quick select options.
         """
+        # Shared Font objects: Tk measures each font once instead of
+        # re-resolving the tuple for every widget and tag_config
+        self.f_mono8 = tkfont.Font(family="Courier New", size=8)
+        self.f_mono9 = tkfont.Font(family="Courier New", size=9)
+        self.f_mono10 = tkfont.Font(family="Courier New", size=10)
+        self.f_mono10_bold = tkfont.Font(family="Courier New", size=10, weight="bold")
+        self.f_mono11_bold = tkfont.Font(family="Courier New", size=11, weight="bold")
+        self.f_mono12_bold = tkfont.Font(family="Courier New", size=12, weight="bold")
+
         # Main split: left ASCII art, right terminal area
         main_frame = tk.Frame(self.root, bg="#000000")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -203,16 +703,19 @@ class StravaGUI:
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=False, padx=10, pady=10)
         left_frame.pack_propagate(False)
 
-        art_label = tk.Label(
-            left_frame,
+        # A Canvas with one create_text caches its own rendering of the
+        # static art, unlike a Label which re-measures the ~30 lines of
+        # glyphs on every redraw (focus changes etc.)
+        art_canvas = tk.Canvas(left_frame, bg="#000000", highlightthickness=0)
+        art_canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        art_canvas.create_text(
+            0,
+            0,
             text=ASCII_ART,
-            fg="#ffffff",
-            bg="#000000",
-            font=("Courier New", 8),
-            justify=tk.LEFT,
-            anchor="nw"
+            anchor="nw",
+            fill="#ffffff",
+            font=self.f_mono8,
         )
-        art_label.pack(side=tk.TOP, anchor="nw")
 
         # Right side: Terminal output and input
         right_frame = tk.Frame(main_frame, bg="#000000")
@@ -224,7 +727,7 @@ class StravaGUI:
             bg="#000000",
             fg="#ffffff",
             insertbackground="#ffffff",
-            font=("Courier New", 9),
+            font=self.f_mono9,
             wrap=tk.WORD,
             relief=tk.FLAT,
             borderwidth=0,
@@ -233,22 +736,23 @@ class StravaGUI:
         self.terminal.pack(fill=tk.BOTH, expand=True)
         
         # Style tags
-        self.terminal.tag_config("title", foreground=COLOR, font=("Courier New", 11, "bold"))
-        self.terminal.tag_config("COLOR_bold", foreground=COLOR, font=("Courier New", 11, "bold"))
-        self.terminal.tag_config("choice", foreground=COLOR, font=("Courier New", 11, "bold"))
+        self.terminal.tag_config("title", foreground=COLOR, font=self.f_mono11_bold)
+        self.terminal.tag_config("COLOR_bold", foreground=COLOR, font=self.f_mono11_bold)
+        self.terminal.tag_config("choice", foreground=COLOR, font=self.f_mono11_bold)
         # Tags for showcase
-        self.terminal.tag_config("sh_header", foreground=COLOR, font=("Courier New", 10, "bold"))
-        self.terminal.tag_config("sh_desc", foreground="#ffffff", font=("Courier New", 10))
+        self.terminal.tag_config("sh_header", foreground=COLOR, font=self.f_mono10_bold)
+        self.terminal.tag_config("sh_desc", foreground="#ffffff", font=self.f_mono10)
         self.terminal.tag_config("sh_right", justify=tk.RIGHT)
-        self.terminal.tag_config("sh_select", background="#222222", foreground=COLOR, font=("Courier New", 10, "bold"))
+        self.terminal.tag_config("sh_select", background="#222222", foreground=COLOR, font=self.f_mono10_bold)
 
         # Quick select options (order follows user's request)
         # "This Week" omitted as requested (redundant)
         self.quick_options = [
             ("Last 7 Days", lambda: self.select_days(7)),
             ("This Month", self.set_this_month),
-            ("All Time", self.select_all_time),
+            ("All Time (up to 10k activities)", self.select_all_time),
             ("Custom", self.prompt_custom_days),
+            ("Clear Cache", self.clear_cache),
         ]
 
         self.selected_option = 0
@@ -259,6 +763,8 @@ class StravaGUI:
         self.preview_start = None
         self.preview_end = None
         self.preview_activities = []
+        # Rows extracted once per fetch, shared by preview and export
+        self._extracted_rows = []
         self.root.resizable(False, False)
         self.root.minsize(600, 400)
         self.root.maxsize(600, 400)
@@ -273,20 +779,54 @@ class StravaGUI:
 
         # Loading overlay placeholder
         self.loading_win = None
+        self._loading_after_id = None
 
         # Preview window reference
         self.preview_win = None
 
     # ------------------ Menu & Interaction Helpers ------------------
+    def _batch_insert(self, segments):
+        """Insert many tagged segments with a single Text.insert call.
+
+        Each insert() is a Tk/Tcl bridge round-trip that re-runs layout;
+        building the full string and tag ranges in Python first collapses
+        dozens of crossings into one insert plus a tag_add per range.
+        segments is a list of (text, tag_or_None) pairs, applied to an
+        empty widget (callers delete first).
+        """
+        parts = []
+        ranges = []
+        line, col = 1, 0
+        for text, tag in segments:
+            start = f"{line}.{col}"
+            parts.append(text)
+            newlines = text.count("\n")
+            if newlines:
+                line += newlines
+                col = len(text) - text.rfind("\n") - 1
+            else:
+                col += len(text)
+            if tag is not None:
+                ranges.append((tag, start, f"{line}.{col}"))
+        self.terminal.insert(tk.END, "".join(parts))
+        for tag, start, end in ranges:
+            self.terminal.tag_add(tag, start, end)
+
     def render_menu(self):
         """Render the quick-select menu in the terminal area."""
         self.terminal.config(state=tk.NORMAL)
         self.terminal.delete("1.0", tk.END)
-        self.terminal.insert(tk.END, "Use ")
-        self.terminal.insert(tk.END, "arrow keys", "COLOR_bold")
-        self.terminal.insert(tk.END, " to select, then press ")
-        self.terminal.insert(tk.END, "Enter", "COLOR_bold")
-        self.terminal.insert(tk.END, "\n\n")
+
+        segments = [
+            ("Use ", None),
+            ("arrow keys", "COLOR_bold"),
+            (" to select, then press ", None),
+            ("Enter", "COLOR_bold"),
+            ("\n\n", None),
+        ]
+
+        # Options start on line 3 (instructions + blank line above)
+        self._menu_first_choice_line = 3
 
         for i, (label, _) in enumerate(self.quick_options):
             if i == self.selected_option:
@@ -297,41 +837,68 @@ class StravaGUI:
                 # Unselected: white text
                 prefix = " "
                 tag = "sh_desc"
-            line = f" {prefix} {label}\n"
-            self.terminal.insert(tk.END, line, tag)
+            segments.append((f" {prefix} {label}\n", tag))
 
-        self.terminal.insert(tk.END, "\n")
+        segments.append(("\n", None))
+        self._batch_insert(segments)
         self.terminal.config(state=tk.DISABLED)
 
-    def update_menu_cursor(self):
-        """Update the visible cursor arrow for the menu."""
-        # Re-render menu to simplify cursor handling
-        self.render_menu()
+    def _move_cursor(self, first_line, labels, old, new):
+        """Redraw only the two choice lines touched by a cursor move.
+
+        Arrow keys used to rebuild the whole terminal contents; this is
+        O(1) per keypress instead.
+        """
+        self.terminal.config(state=tk.NORMAL)
+        for index, selected in ((old, False), (new, True)):
+            prefix, tag = ("►", "choice") if selected else (" ", "sh_desc")
+            line = first_line + index
+            self.terminal.delete(f"{line}.0", f"{line}.end")
+            self.terminal.insert(f"{line}.0", f" {prefix} {labels[index]}", tag)
+        self.terminal.config(state=tk.DISABLED)
 
     def on_up(self, event):
         """Navigate up in the menu."""
         if self.preview_mode:
             if self.preview_choice > 0:
                 self.preview_choice -= 1
-            # Re-render the entire preview table (like main menu)
-            self._render_preview_table(self.preview_activities, self.preview_start, self.preview_end)
+                self._move_cursor(
+                    self._preview_first_choice_line,
+                    self.PREVIEW_CHOICES,
+                    self.preview_choice + 1,
+                    self.preview_choice,
+                )
         else:
             if self.selected_option > 0:
                 self.selected_option -= 1
-                self.update_menu_cursor()
+                self._move_cursor(
+                    self._menu_first_choice_line,
+                    [label for label, _ in self.quick_options],
+                    self.selected_option + 1,
+                    self.selected_option,
+                )
         return "break"
 
     def on_down(self, event):
         """Navigate down in the menu."""
         if self.preview_mode:
-            if self.preview_choice < 1:
+            if self.preview_choice < len(self.PREVIEW_CHOICES) - 1:
                 self.preview_choice += 1
-            # Re-render the entire preview table (like main menu)
-            self._render_preview_table(self.preview_activities, self.preview_start, self.preview_end)
+                self._move_cursor(
+                    self._preview_first_choice_line,
+                    self.PREVIEW_CHOICES,
+                    self.preview_choice - 1,
+                    self.preview_choice,
+                )
         else:
             if self.selected_option < len(self.quick_options) - 1:
                 self.selected_option += 1
-                self.update_menu_cursor()
+                self._move_cursor(
+                    self._menu_first_choice_line,
+                    [label for label, _ in self.quick_options],
+                    self.selected_option - 1,
+                    self.selected_option,
+                )
         return "break"
 
     def on_enter(self, event):
@@ -360,77 +927,79 @@ class StravaGUI:
             action()
         return "break"
 
-    def select_days(self, days: int):
-        """Common path for fixed-day selections."""
-        end = datetime.now()
-        start = end - timedelta(days=days)
-        # show loading and then fetch/preview
-        self.show_loading()
-        threading.Thread(target=self._fetch_activities_thread_range, args=(start, end), daemon=True).start()
+    def select_days(self, days: int, max_activities: Optional[int] = None):
+        """Common path for fixed-day selections.
+
+        Plain epoch arithmetic — datetimes are only built later for the
+        preview labels. `before` is rounded up to the next hour so that
+        repeat selections within the hour build identical page params:
+        raw time.time() values would give every request a fresh cache
+        key and the SQLite cache would never hit. The hour granularity
+        matches the 1-hour TTL on live-range pages.
+        """
+        before = -(-int(time.time()) // 3600) * 3600
+        self._start_fetch(before - days * 86400, before, max_activities)
 
     def set_this_week(self):
         today = datetime.now()
         start = today - timedelta(days=today.weekday())
         end = today
         self.show_loading()
-        threading.Thread(target=self.fetch_and_preview, args=(start, end), daemon=True).start()
+        self._worker.submit(self.fetch_and_preview, start, end)
 
     def set_this_month(self):
         # Use a 30-day window from now for "This Month" to match expected behaviour
-        end = datetime.now()
-        start = end - timedelta(days=30)
-        self.show_loading()
-        threading.Thread(target=self._fetch_activities_thread_range, args=(start, end), daemon=True).start()
+        self.select_days(30)
 
     def select_all_time(self):
-        # Use a practical 'all time' window (last 10 years) to avoid huge queries
-        start = datetime.now() - timedelta(days=3650)
-        end = datetime.now()
+        # Use a practical 'all time' window (last 10 years) and cap the
+        # activity count so a dense history can't scan pages unbounded
+        self.select_days(3650, max_activities=self.ALL_TIME_CAP)
+
+    def _start_fetch(self, after: int, before: int, max_activities: Optional[int] = None):
+        """Show the loading overlay and fetch a timestamp range off-thread."""
         self.show_loading()
-        threading.Thread(target=self._fetch_activities_thread_range, args=(start, end), daemon=True).start()
+        self._worker.submit(
+            self._fetch_activities_thread_range, after, before, max_activities
+        )
+
+    def clear_cache(self):
+        """Drop all cached API responses so the next fetch is cold."""
+        self.extractor.session.cache.clear()
+        self.terminal.config(state=tk.NORMAL)
+        self.terminal.insert(tk.END, "\nCache cleared — next fetch will hit the API.\n")
+        self.terminal.config(state=tk.DISABLED)
 
     def prompt_custom_days(self):
-        """Prompt user for integer days back using terminal-style input."""
+        """Prompt user for integer days back using an inline Entry.
+
+        An Entry renders keystrokes natively in C — no per-character
+        Text-widget writes — and avoids the global <Key> grab that used
+        to hijack the arrow/Enter bindings.
+        """
         self.terminal.config(state=tk.NORMAL)
         self.terminal.insert(tk.END, "\nEnter number of days back (integer): ", "COLOR_bold")
-        self.terminal.insert(tk.END, "")
+        self.custom_entry = ttk.Entry(self.terminal, width=8, font=self.f_mono10)
+        self.terminal.window_create(tk.END, window=self.custom_entry)
         self.terminal.config(state=tk.DISABLED)
 
-        # bind simple numeric input
-        self.custom_input = ""
-        self.root.bind('<Key>', self._on_custom_key)
+        self.custom_entry.focus_set()
+        self.custom_entry.bind("<Return>", self._on_custom_days_entered)
 
-    def _on_custom_key(self, event):
-        if event.keysym == 'Return':
-            try:
-                days = int(self.custom_input.strip())
-            except Exception:
-                # invalid
-                self.terminal.config(state=tk.NORMAL)
-                self.terminal.insert(tk.END, "\nInvalid number. Cancelling.\n")
-                self.terminal.config(state=tk.DISABLED)
-                self.root.unbind('<Key>')
-                self.render_menu()
-                return
-            self.root.unbind('<Key>')
-            end = datetime.now()
-            start = end - timedelta(days=days)
-            self.show_loading()
-            threading.Thread(target=self._fetch_activities_thread_range, args=(start, end), daemon=True).start()
-        elif event.keysym == 'BackSpace':
-            if self.custom_input:
-                self.custom_input = self.custom_input[:-1]
-                self.terminal.config(state=tk.NORMAL)
-                # remove last char from the widget
-                self.terminal.delete("end-2c", tk.END)
-                self.terminal.config(state=tk.DISABLED)
-        else:
-            ch = event.char
-            if ch.isdigit():
-                self.custom_input += ch
-                self.terminal.config(state=tk.NORMAL)
-                self.terminal.insert(tk.END, ch)
-                self.terminal.config(state=tk.DISABLED)
+    def _on_custom_days_entered(self, event):
+        try:
+            days = int(self.custom_entry.get().strip())
+        except ValueError:
+            self.custom_entry.destroy()
+            self.terminal.config(state=tk.NORMAL)
+            self.terminal.insert(tk.END, "\nInvalid number. Cancelling.\n")
+            self.terminal.config(state=tk.DISABLED)
+            self.render_menu()
+            return "break"
+
+        self.custom_entry.destroy()
+        self.select_days(days)
+        return "break"
 
     # ------------------ Loading & Fetching ------------------
     def show_loading(self):
@@ -447,21 +1016,29 @@ class StravaGUI:
 
         canvas = tk.Canvas(self.loading_win, width=300, height=200, bg="#000000", highlightthickness=0)
         canvas.pack()
-        text = canvas.create_text(150, 70, text="Fetching activities...", fill="#FFD300", font=("Courier New", 12, "bold"))
+        text = canvas.create_text(150, 70, text="Fetching activities...", fill="#FFD300", font=self.f_mono12_bold)
         arc = canvas.create_arc(100, 90, 200, 190, start=0, extent=90, style=tk.ARC, outline=COLOR, width=4)
 
         def rotate(angle=0):
-            try:
-                canvas.delete(arc)
-            except Exception:
-                pass
-            a = canvas.create_arc(100, 90, 200, 190, start=angle, extent=90, style=tk.ARC, outline=COLOR, width=4)
-            self.loading_win.after(100, lambda: rotate((angle + 30) % 360))
+            # Spin the existing arc in place rather than destroying and
+            # recreating a canvas item every tick
+            canvas.itemconfig(arc, start=angle)
+            self._loading_after_id = self.loading_win.after(
+                100, rotate, (angle + 30) % 360
+            )
 
         rotate()
 
     def hide_loading(self):
         if self.loading_win:
+            # Stop the animation timer so it doesn't keep firing against
+            # a destroyed window
+            if self._loading_after_id:
+                try:
+                    self.loading_win.after_cancel(self._loading_after_id)
+                except Exception:
+                    pass
+                self._loading_after_id = None
             try:
                 self.loading_win.destroy()
             except Exception:
@@ -476,25 +1053,48 @@ class StravaGUI:
             activities = []
             print("Fetch error:", e)
 
+        # This path bypasses _handle_fetch_result, so drop any rows
+        # cached from a previous fetch
+        self._extracted_rows = []
+
         # Hide loading and show preview in main thread
         self.root.after(0, lambda: self.hide_loading())
         self.root.after(0, lambda: self.show_preview_window(activities, start_date, end_date))
 
-    def _fetch_activities_thread_range(self, start_date: datetime, end_date: datetime):
+    def _fetch_activities_thread_range(
+        self, after: int, before: int, max_activities: Optional[int] = None
+    ):
         """Legacy-style fetch thread: logs params, fetches activities and routes results to handler."""
         try:
-            after = int(start_date.timestamp())
-            before = int(end_date.timestamp())
             print("Fetching activities with params:", {"after": after, "before": before, "per_page": 200})
-            activities = self.extractor.get_activities(start_date, end_date, per_page=200)
+            activities = self.extractor.get_activities_ts(
+                after, before, per_page=200, max_activities=max_activities
+            )
         except Exception as e:
             activities = []
             print("Fetch error:", e)
 
+        # Extract rows here on the worker thread so preview and export
+        # both reuse them without redoing the transform
+        extracted = (
+            [self.extractor.extract_activity_data(a) for a in activities]
+            if activities
+            else []
+        )
+
+        # Datetimes are only needed for the preview labels downstream
+        start_date = datetime.fromtimestamp(after)
+        end_date = datetime.fromtimestamp(before)
+
         # Handle results on main thread
-        self.root.after(0, lambda: self._handle_fetch_result(activities, start_date, end_date))
+        self.root.after(
+            0,
+            lambda: self._handle_fetch_result(
+                activities, extracted, start_date, end_date
+            ),
+        )
 
-    def _handle_fetch_result(self, activities, start_date, end_date):
+    def _handle_fetch_result(self, activities, extracted, start_date, end_date):
         """Update terminal UI and show preview using legacy logic style."""
         # Always hide loading overlay
         try:
@@ -502,6 +1102,8 @@ class StravaGUI:
         except Exception:
             pass
 
+        self._extracted_rows = extracted or []
+
         if activities is None:
             # Auth problem
             self.terminal.config(state=tk.NORMAL)
@@ -532,11 +1134,11 @@ class StravaGUI:
 
         # Title
         title = f"extracted data from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}@cutie-extractor\n\n"
-        self.terminal.insert(tk.END, title, "sh_header")
 
         # Summary
         summary = f"{len(activities)} Activities\n\n"
-        self.terminal.insert(tk.END, summary, "sh_header")
+
+        segments = [(title, "sh_header"), (summary, "sh_header")]
 
         # Column descriptions (no sample rows, just headers with types)
         headers_info = [
@@ -557,15 +1159,18 @@ class StravaGUI:
         ]
 
         for header, desc in headers_info:
-            # Insert header name in orange bold, then description
-            self.terminal.insert(tk.END, header, "sh_header")
-            self.terminal.insert(tk.END, f": {desc}\n", "sh_desc")
+            # Header name in orange bold, then description
+            segments.append((header, "sh_header"))
+            segments.append((f": {desc}\n", "sh_desc"))
+
+        segments.append(("\n", None))
+
+        # Choices land after title+summary blocks and the header list;
+        # remember the line so cursor moves can redraw in place
+        self._preview_first_choice_line = 6 + len(headers_info)
 
-        self.terminal.insert(tk.END, "\n")
-        
         # Render choices (Export CSV / Back)
-        choices = ["Export CSV", "Back"]
-        for i, choice in enumerate(choices):
+        for i, choice in enumerate(self.PREVIEW_CHOICES):
             if i == self.preview_choice:
                 # Highlight selected choice
                 prefix = "►"
@@ -573,8 +1178,9 @@ class StravaGUI:
             else:
                 prefix = " "
                 tag = "sh_desc"
-            line = f" {prefix} {choice}\n"
-            self.terminal.insert(tk.END, line, tag)
+            segments.append((f" {prefix} {choice}\n", tag))
+
+        self._batch_insert(segments)
 
         # Keep the view at the bottom (don't scroll up)
         self.terminal.see(tk.END)
@@ -602,7 +1208,7 @@ class StravaGUI:
         export_btn.pack(side=tk.RIGHT)
 
         # Table area (scrolled text monospace)
-        txt = scrolledtext.ScrolledText(self.preview_win, font=("Courier New", 10), wrap=tk.NONE)
+        txt = scrolledtext.ScrolledText(self.preview_win, font=self.f_mono10, wrap=tk.NONE)
         txt.pack(fill=tk.BOTH, expand=True, padx=10, pady=6)
 
         # Prepare columns and rows
@@ -611,48 +1217,61 @@ class StravaGUI:
             txt.config(state=tk.DISABLED)
             return
 
-        # Use extractor to get ordered fields as in API order specified by user
-        headers = [
-            "id", "name", "distance", "moving_time", "elapsed_time",
-            "total_elevation_gain", "start_date", "average_speed", "max_speed",
-            "average_temp", "elev_high", "elev_low", "calories", "pr_count",
-        ]
+        # Ordered fields as in API order specified by user
+        headers = FIELDNAMES
 
-        # Build rows (show up to 15 rows)
-        rows = []
-        for activity in activities[:15]:
-            ex = self.extractor.extract_activity_data(activity)
-            row = [str(ex.get(h, "")) for h in headers]
-            rows.append(row)
+        # Build rows (show up to 15 rows), reusing the rows extracted at
+        # fetch time when available
+        sample = self._extracted_rows[:15] or [
+            self.extractor.extract_activity_data(a) for a in activities[:15]
+        ]
+        # Activity tuples are already in FIELDNAMES order
+        rows = [[str(v) for v in ex] for ex in sample]
 
         # compute col widths
         col_widths = [max(len(h), max((len(row[i]) for row in rows), default=0)) + 2 for i, h in enumerate(headers)]
 
-        # header line
+        # Assemble the whole table in Python and insert it once; per-line
+        # inserts each reflow the Text widget
         header_line = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-        txt.insert(tk.END, header_line + "\n")
-        txt.insert(tk.END, "-" * len(header_line) + "\n")
-
-        for r in rows:
-            line = " | ".join(r[i].ljust(col_widths[i]) for i in range(len(headers)))
-            txt.insert(tk.END, line + "\n")
-
-        txt.insert(tk.END, "\n")
-        txt.insert(tk.END, f"Showing {len(rows)} of {len(activities)} activities\n")
+        parts = [header_line, "-" * len(header_line)]
+        parts.extend(
+            " | ".join(r[i].ljust(col_widths[i]) for i in range(len(headers)))
+            for r in rows
+        )
+        parts.append("")
+        parts.append(f"Showing {len(rows)} of {len(activities)} activities\n")
+        txt.insert("1.0", "\n".join(parts))
         txt.config(state=tk.DISABLED)
 
     def export_preview_csv(self, activities, start_date, end_date):
-        """Export previewed activities to Downloads CSV."""
+        """Export previewed activities to Downloads CSV on a worker thread."""
         if not activities:
             messagebox.showwarning("No Data", "No activities to export")
             return
 
-        downloads = Path.home() / "Downloads"
         filename = f"strava_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv"
-        filepath = downloads / filename
+        filepath = self._downloads / filename
+
+        # Write on the worker so the UI keeps redrawing during big
+        # exports; the result messagebox hops back to the main thread
+        self.show_loading()
+        self._worker.submit(self._export_worker, activities, filepath)
+
+    def _export_worker(self, activities, filepath):
+        """Background CSV write; reports back via root.after."""
+        # Prefer the rows extracted at fetch time over re-transforming
+        if self._extracted_rows:
+            success = self.extractor.export_rows_to_csv(
+                self._extracted_rows, str(filepath)
+            )
+        else:
+            success = self.extractor.export_to_csv(activities, str(filepath))
+        self.root.after(0, lambda: self._export_done(success, filepath))
 
-        # write CSV using extractor
-        success = self.extractor.export_to_csv(activities, str(filepath))
+    def _export_done(self, success, filepath):
+        """Main-thread completion handler for a background export."""
+        self.hide_loading()
         if success:
             messagebox.showinfo("Exported", f"Exported to {filepath}")
         else: